@@ -8,6 +8,8 @@ memory monitoring, and flexible data export capabilities.
 
 import argparse
 import asyncio
+import functools
+import operator
 import json
 import os
 import re
@@ -15,6 +17,7 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
@@ -38,6 +41,37 @@ from rich.rule import Rule
 
 console = Console()
 
+# Ollama tuning variables worth surfacing in the startup banner
+_MONITORED_ENV_VARS = ['OLLAMA_NUM_PARALLEL', 'OLLAMA_MAX_LOADED_MODELS',
+                       'OLLAMA_FLASH_ATTENTION', 'OLLAMA_KV_CACHE_TYPE',
+                       'OLLAMA_KEEP_ALIVE', 'CUDA_VISIBLE_DEVICES']
+
+# Precomputed markup strings for table cells - rebuilt on every Live refresh
+_YES = "[green]YES[/green]"
+_NO = "[yellow]NO[/yellow]"
+_ERR = "[red]ERROR[/red]"
+_HOURGLASS = "[yellow]⏳[/yellow]"
+_LOADING = "[dim]loading...[/dim]"
+_STREAMING = "[yellow]STREAMING...[/yellow]"
+
+
+@functools.lru_cache(maxsize=256)
+def _render_progress_bar(completed: int, total: int, width: int) -> str:
+    """Render a progress bar string, cached by (completed, total, width)"""
+    if total == 0:
+        return "[green]" + "█" * width + "[/green] 100%"
+
+    progress_ratio = completed / total
+    filled_width = int(width * progress_ratio)
+    empty_width = width - filled_width
+
+    # Use █ (full block) for filled and ░ (light shade) for empty - more visible
+    filled_bar = "█" * filled_width
+    empty_bar = "░" * empty_width
+    percentage = int(progress_ratio * 100)
+
+    return f"[green]{filled_bar}[/green][dim]{empty_bar}[/dim] {percentage}% ({completed}/{total})"
+
 
 @dataclass
 class BenchmarkConfig:
@@ -692,24 +726,28 @@ class BenchmarkResult:
             return len(self.response_text) / self.eval_s
         return 0
 
+    # Export columns with their getters, built once at class definition so
+    # to_dict avoids re-resolving attributes/rounding logic per call
+    _EXPORT_GETTERS = (
+        ('model', operator.attrgetter('model')),
+        ('timestamp', lambda r: r.timestamp.isoformat()),
+        ('preloaded', operator.attrgetter('preloaded')),
+        ('tokens', operator.attrgetter('tokens')),
+        ('load_s', lambda r: round(r.load_s, 3)),
+        ('eval_s', lambda r: round(r.eval_s, 3)),
+        ('total_s', lambda r: round(r.total_s, 3)),
+        ('prompt_eval_s', lambda r: round(r.prompt_eval_s, 3)),
+        ('tokens_per_second', lambda r: round(r.tokens_per_second, 1)),
+        ('chars_per_token', lambda r: round(r.chars_per_token, 2) if r.chars_per_token > 0 else 0),
+        ('chars_per_second', lambda r: round(r.chars_per_second, 1) if r.chars_per_second > 0 else 0),
+        ('context_length', operator.attrgetter('context_length')),
+        ('label', operator.attrgetter('label')),
+        ('error', operator.attrgetter('error')),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for export (without system info - saved separately)"""
-        d = {
-            'model': self.model,
-            'timestamp': self.timestamp.isoformat(),
-            'preloaded': self.preloaded,
-            'tokens': self.tokens,
-            'load_s': round(self.load_s, 3),
-            'eval_s': round(self.eval_s, 3),
-            'total_s': round(self.total_s, 3),
-            'prompt_eval_s': round(self.prompt_eval_s, 3),
-            'tokens_per_second': round(self.tokens_per_second, 1),
-            'chars_per_token': round(self.chars_per_token, 2) if self.chars_per_token > 0 else 0,
-            'chars_per_second': round(self.chars_per_second, 1) if self.chars_per_second > 0 else 0,
-            'context_length': self.context_length,
-            'label': self.label,
-            'error': self.error,
-        }
+        d = {name: get(self) for name, get in self._EXPORT_GETTERS}
 
         if self.model_info:
             d['disk_gb'] = self.model_info.disk_gb
@@ -732,6 +770,7 @@ class OllamaBenchmark:
         self.api_base = f"http://{config.host}:{config.port}"
         self.results: List[BenchmarkResult] = []
         self._model_cache: Dict[str, ModelInfo] = {}
+        self._io_pool = ThreadPoolExecutor(max_workers=2)  # Background unloads etc.
         self.system_info = collect_system_info()  # Collect once at initialization
 
     def get_available_models(self) -> List[ModelInfo]:
@@ -1018,6 +1057,7 @@ Requirements:
                 streaming=False,  # Not yet streaming
                 last_response_model=current_last_response_model
             ))
+            live_display.refresh()
 
             response = requests.post(
                 f"{self.api_base}/api/generate",
@@ -1038,12 +1078,11 @@ Requirements:
                         if 'response' in chunk:
                             response_text += chunk['response']
 
-                        # Update display on every chunk or every 0.1 seconds (whichever comes first)
+                        # Update display at most every 0.1 seconds - with explicit
+                        # refresh this caps render work at ~10 frames/s instead of
+                        # rendering once per token
                         current_time = time.time()
-                        should_update = (
-                            'response' in chunk or  # Always update when we get new content
-                            (current_time - last_update_time) > 0.1  # Force update every 100ms
-                        )
+                        should_update = (current_time - last_update_time) > 0.1
 
                         if should_update:
                             display_response = response_text if response_text else current_last_response
@@ -1056,6 +1095,7 @@ Requirements:
                                 streaming=bool(response_text),  # Only show as streaming when we have new text
                                 last_response_model=response_model
                             ))
+                            live_display.refresh()
                             last_update_time = current_time
 
                         # Extract metrics from final chunk
@@ -1286,19 +1326,7 @@ Requirements:
             panel_padding = 6
             width = max(20, terminal_width - reserved_space - panel_padding)
 
-        if total == 0:
-            return "[green]" + "█" * width + "[/green] 100%"
-
-        progress_ratio = completed / total
-        filled_width = int(width * progress_ratio)
-        empty_width = width - filled_width
-
-        # Use █ (full block) for filled and ░ (light shade) for empty - more visible
-        filled_bar = "█" * filled_width
-        empty_bar = "░" * empty_width
-        percentage = int(progress_ratio * 100)
-
-        return f"[green]{filled_bar}[/green][dim]{empty_bar}[/dim] {percentage}% ({completed}/{total})"
+        return _render_progress_bar(completed, total, width)
 
     def get_scrolled_text(self, text: str, max_lines: int = 8, from_end: bool = True) -> str:
         """Get scrolled view of text showing the most recent lines"""
@@ -1353,12 +1381,15 @@ Requirements:
 
         # Add rows
         for result in results:
+            if result is None:
+                # Preallocated slot not yet filled
+                continue
             if isinstance(result, PartialResult):
                 # Partial result (still running)
                 row = [
                     result.model,
                     result.model_info.disk_size_str if result.model_info else "n/a",
-                    "[green]YES[/green]" if result.preloaded else "[yellow]NO[/yellow]",
+                    _YES if result.preloaded else _NO,
                     "..."  # Context unknown while running
                 ]
 
@@ -1367,16 +1398,16 @@ Requirements:
                     row.append(f"[bright_yellow]{result.memory_info.split_str}[/bright_yellow]")
                     row.append(f"[bright_cyan]{result.memory_info.size_str}[/bright_cyan]")
                 else:
-                    row.extend(["[dim]loading...[/dim]", "[dim]loading...[/dim]"])
+                    row.extend([_LOADING, _LOADING])
 
                 # Show running status for metrics
                 if result.status == "RUNNING":
                     row.extend([
-                        "[yellow]⏳[/yellow]",  # Load
-                        "[yellow]⏳[/yellow]",  # Eval
-                        "[yellow]STREAMING...[/yellow]",  # Tok/s
-                        "...",                  # Ch/Tok
-                        "[yellow]⏳[/yellow]"   # Total
+                        _HOURGLASS,   # Load
+                        _HOURGLASS,   # Eval
+                        _STREAMING,   # Tok/s
+                        "...",        # Ch/Tok
+                        _HOURGLASS    # Total
                     ])
                 else:
                     row.extend(["...", "...", "...", "...", "..."])
@@ -1394,11 +1425,11 @@ Requirements:
                 row.extend(["n/a", "n/a"])
 
                 row.extend([
-                    "[red]ERROR[/red]",  # Load
-                    "[red]ERROR[/red]",  # Eval
-                    "[red]ERROR[/red]",  # Tok/s
-                    "[red]ERROR[/red]",  # Ch/Tok
-                    "[red]ERROR[/red]"   # Total
+                    _ERR,  # Load
+                    _ERR,  # Eval
+                    _ERR,  # Tok/s
+                    _ERR,  # Ch/Tok
+                    _ERR   # Total
                 ])
 
             else:
@@ -1406,7 +1437,7 @@ Requirements:
                 row = [
                     result.model,
                     result.model_info.disk_size_str if result.model_info else "n/a",
-                    "[green]YES[/green]" if result.preloaded else "[yellow]NO[/yellow]",
+                    _YES if result.preloaded else _NO,
                     str(result.context_length) if result.context_length else "n/a",
                 ]
 
@@ -1499,6 +1530,24 @@ Requirements:
                 json.dump(self.system_info.to_dict(), f, indent=2, default=str)
             console.print(f"[green]✓[/green] System info saved to {system_info_path}")
 
+    @functools.cached_property
+    def _env_panel(self) -> Optional[Panel]:
+        """Environment panel built once per process (os.environ is stable)"""
+        env_table = Table(show_header=False, box=None)
+        env_table.add_column("Variable", style="dim")
+        env_table.add_column("Value", style="white")
+
+        has_env = False
+        for var in _MONITORED_ENV_VARS:
+            value = os.environ.get(var)
+            if value:
+                env_table.add_row(var, value)
+                has_env = True
+
+        if not has_env:
+            return None
+        return Panel(env_table, title="Environment", border_style="dim")
+
     def run(self) -> None:
         """Run the complete benchmark suite with live updates"""
         # Print initial header
@@ -1543,23 +1592,8 @@ Requirements:
         console.print(Panel(sys_table, title="System Information", border_style="blue"))
 
         # Print environment variables if set
-        env_vars = ['OLLAMA_NUM_PARALLEL', 'OLLAMA_MAX_LOADED_MODELS',
-                   'OLLAMA_FLASH_ATTENTION', 'OLLAMA_KV_CACHE_TYPE',
-                   'OLLAMA_KEEP_ALIVE', 'CUDA_VISIBLE_DEVICES']
-
-        env_table = Table(show_header=False, box=None)
-        env_table.add_column("Variable", style="dim")
-        env_table.add_column("Value", style="white")
-
-        has_env = False
-        for var in env_vars:
-            value = os.environ.get(var)
-            if value:
-                env_table.add_row(var, value)
-                has_env = True
-
-        if has_env:
-            console.print(Panel(env_table, title="Environment", border_style="dim"))
+        if self._env_panel:
+            console.print(self._env_panel)
 
         # Load prompt
         prompt = self.load_prompt()
@@ -1575,37 +1609,54 @@ Requirements:
         console.print("[yellow]Starting live benchmark display...[/yellow]\n")
 
         # Run benchmarks with live display
-        all_results = []
         last_response = None
         last_response_model = None
 
         # Create initial layout
         initial_layout = self.create_live_layout([], models[0] if models else None)
 
-        with Live(initial_layout, refresh_per_second=2, screen=True) as live:
+        # auto_refresh off: we refresh explicitly when a result completes or a
+        # streaming chunk arrives, so render work tracks events, not wall time
+        with Live(initial_layout, auto_refresh=False, screen=True, console=console) as live:
             prev_model = None
-            total_runs = len(models) * self.config.repeat_runs
+            # Preallocate result slots and bind hot attributes/methods to locals
+            # to keep per-iteration work out of the tight run loop
+            repeat_runs = self.config.repeat_runs
+            enable_streaming = self.config.enable_streaming
+            build_layout = self.create_live_layout
+            run_bench = self.run_benchmark
+            run_stream = self.run_benchmark_streaming
+            total_runs = len(models) * repeat_runs
+            all_results = [None] * total_runs
             completed = 0
 
+            stop_future = None
             for model_idx, model in enumerate(models):
-                # Always stop previous model for consistent benchmarking
+                # Always stop previous model for consistent benchmarking, but do
+                # it in the background so per-iteration setup overlaps the unload
                 if prev_model:
-                    self.stop_model(prev_model)
+                    stop_future = self._io_pool.submit(self.stop_model, prev_model)
 
-                for run_idx in range(self.config.repeat_runs):
+                for run_idx in range(repeat_runs):
                     completed += 1
-                    run_label = f"Run {run_idx+1}/{self.config.repeat_runs}" if self.config.repeat_runs > 1 else ""
+                    run_label = f"Run {run_idx+1}/{repeat_runs}" if repeat_runs > 1 else ""
                     progress_bar = self.create_progress_bar(completed, total_runs)
                     progress_text = f"[white]Testing:[/white] {model} {run_label}\n{progress_bar}"
 
+                    # Wait for any pending unload only now, right before the
+                    # next generate goes out
+                    if stop_future is not None:
+                        stop_future.result(timeout=10)
+                        stop_future = None
+
                     # Run the benchmark (streaming or non-streaming)
                     next_model = models[model_idx + 1] if model_idx + 1 < len(models) else None
-                    if self.config.enable_streaming:
+                    if enable_streaming:
                         # Pass current last_response to streaming method
-                        result = self.run_benchmark_streaming(model, prompt, live, all_results, progress_text, next_model, last_response, last_response_model)
+                        result = run_stream(model, prompt, live, all_results, progress_text, next_model, last_response, last_response_model)
                     else:
                         # Update layout for non-streaming
-                        live.update(self.create_live_layout(
+                        live.update(build_layout(
                             all_results,
                             model,
                             last_response,
@@ -1613,17 +1664,17 @@ Requirements:
                             streaming=False,
                             last_response_model=last_response_model
                         ))
-                        result = self.run_benchmark(model, prompt)
-                    all_results.append(result)
-                    self.results.append(result)
+                        live.refresh()
+                        result = run_bench(model, prompt)
+                    all_results[completed - 1] = result
 
                     # Update last response if successful
                     if result.response_text and not result.error:
                         last_response = result.response_text
                         last_response_model = model
 
-                    # Update layout with completed result
-                    progress_bar = self.create_progress_bar(completed, total_runs)
+                    # Update layout with completed result (bar value is unchanged,
+                    # so reuse the string rendered at the top of the iteration)
                     progress_text = f"[green]Completed:[/green] {model} {run_label}\n{progress_bar}"
                     live.update(self.create_live_layout(
                         all_results,
@@ -1633,6 +1684,7 @@ Requirements:
                         streaming=False,
                         last_response_model=last_response_model
                     ))
+                    live.refresh()
 
                     # Brief pause to show result before next test
                     time.sleep(1)
@@ -1644,6 +1696,8 @@ Requirements:
 
                 prev_model = model
 
+        self.results = all_results
+
         # Show final results
         console.print("\n" + "="*80)
         console.print("[bold green]🎉 Benchmark Complete![/bold green]")
@@ -1666,11 +1720,13 @@ Requirements:
 
     def display_statistics(self, results: List[BenchmarkResult]) -> None:
         """Display statistical summary for multiple runs"""
-        df = pd.DataFrame([r.to_dict() for r in results if not r.error])
-
-        if df.empty:
+        # Check for successful runs before paying the serialization cost
+        ok = [r for r in results if not r.error]
+        if not ok:
             return
 
+        df = pd.DataFrame([r.to_dict() for r in ok])
+
         stats_table = Table(
             title="Statistical Summary",
             show_header=True,
@@ -1811,6 +1867,10 @@ def parse_arguments() -> argparse.Namespace:
         '--seed', type=int,
         help='Random seed for deterministic results'
     )
+    adv_group.add_argument(
+        '--daemon', dest='_daemon_flag', action='store_true',
+        help='Serve benchmark requests as NDJSON over stdin/stdout (for run_matrix.py)'
+    )
     adv_group.add_argument(
         '--debug', action='store_true',
         help='Enable debug output'
@@ -1819,6 +1879,51 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def run_daemon(config: BenchmarkConfig) -> None:
+    """Serve benchmark requests as NDJSON over stdin/stdout
+
+    Keeps one interpreter (and one OllamaBenchmark with its collected system
+    info) alive across requests so a matrix run pays startup/import cost
+    once instead of per context size. Each stdin line is a JSON object that
+    may override num_ctx, label, output_dir and formats; one JSON response
+    line is written per request. Rich output moves to stderr so stdout stays
+    a clean response channel.
+    """
+    global console
+    console = Console(stderr=True)
+
+    benchmark = OllamaBenchmark(config)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(json.dumps({'ok': False, 'error': f'Invalid request: {e}'}), flush=True)
+            continue
+
+        try:
+            if 'num_ctx' in request:
+                config.num_ctx = int(request['num_ctx'])
+            if 'label' in request:
+                config.label = request['label']
+            if 'output_dir' in request:
+                config.output_dir = Path(request['output_dir'])
+            formats = request.get('formats')
+            if formats is not None:
+                config.export_csv = 'csv' in formats
+                config.export_json = 'json' in formats
+                config.export_parquet = 'parquet' in formats
+
+            benchmark.run()
+            print(json.dumps({'ok': True, 'num_ctx': config.num_ctx, 'label': config.label}), flush=True)
+        except Exception as e:
+            print(json.dumps({'ok': False, 'error': str(e)}), flush=True)
+
+
 def main():
     """Main entry point"""
     args = parse_arguments()
@@ -1857,6 +1962,9 @@ def main():
 
     # Run benchmark
     try:
+        if args._daemon_flag:
+            run_daemon(config)
+            return
         benchmark = OllamaBenchmark(config)
         benchmark.run()
     except KeyboardInterrupt:
@@ -5,13 +5,14 @@ Generates .env from .env.example using directive-based templating.
 """
 
 import argparse
+import functools
 import os
 import re
 import secrets
 import string
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Iterator, Optional, Dict
 
 
 class CredentialGenerator:
@@ -23,9 +24,30 @@ class CredentialGenerator:
     # Excluded: { } (brace expansion), ! (history expansion in some shells)
     PASSWORD_CHARS = string.ascii_letters + string.digits + '@#%^*()_+-=[]:./?'
 
+    # Alphanumeric charset for S3-style keys, built once at class scope
+    ALNUM_CHARS = string.ascii_letters + string.digits
+
+    def _random_chars(self, chars: str, length: int) -> str:
+        """Draw unbiased random characters from a charset in batched reads.
+
+        One secrets.token_bytes call replaces a per-character secrets.choice
+        loop (one urandom read each). Bytes at or above the largest multiple
+        of len(chars) are rejected to keep the distribution uniform.
+        """
+        n = len(chars)
+        limit = 256 - (256 % n)
+        picks = []
+        while len(picks) < length:
+            # Size the draw for the expected rejection rate (256/limit),
+            # plus a little slack so a second draw is rare
+            needed = length - len(picks)
+            pool = secrets.token_bytes(-(-needed * 256 // limit) + 4)
+            picks.extend(chars[b % n] for b in pool if b < limit)
+        return ''.join(picks[:length])
+
     def strong_password(self, length: int = 24) -> str:
         """Generate a strong mixed-character password."""
-        return ''.join(secrets.choice(self.PASSWORD_CHARS) for _ in range(length))
+        return self._random_chars(self.PASSWORD_CHARS, length)
 
     def hex_key(self, length: int = 32) -> str:
         """Generate a hexadecimal key."""
@@ -37,8 +59,7 @@ class CredentialGenerator:
 
     def s3_access_key(self, length: int = 20) -> str:
         """Generate an S3-style access key (alphanumeric)."""
-        chars = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(chars) for _ in range(length))
+        return self._random_chars(self.ALNUM_CHARS, length)
 
 
 class TemplateProcessor:
@@ -47,19 +68,20 @@ class TemplateProcessor:
     def __init__(self, config: Dict[str, str]):
         self.config = config
 
-    def process(self, template_name: str) -> str:
-        """Process a template directive."""
-        # Remove quotes if present
-        template_name = template_name.strip('"\'')
-
-        templates = {
+        # Dispatch table built once here instead of on every process() call
+        self._templates = {
             'protocol': self._protocol,
             'n8n_host': self._n8n_host,
             'n8n_webhook_url': self._n8n_webhook_url,
             'langfuse_url': self._langfuse_url,
         }
 
-        processor = templates.get(template_name)
+    def process(self, template_name: str) -> str:
+        """Process a template directive."""
+        # Remove quotes if present
+        template_name = template_name.strip('"\'')
+
+        processor = self._templates.get(template_name)
         if processor:
             return processor()
         return template_name
@@ -94,69 +116,82 @@ class TemplateProcessor:
 class DirectiveParser:
     """Parses and processes GENERATE directives from comments."""
 
-    DIRECTIVE_PATTERN = re.compile(r'#\s*GENERATE:\s*(\w+)(?:\(([^)]*)\))?\s*\|')
+    DIRECTIVE_PATTERN = re.compile(r'\s*#\s*GENERATE:\s*(\w+)(?:\(([^)]*)\))?\s*\|')
+
+    # Default lengths for credential directives; used at parse time so the
+    # argument reaches the handlers as an already-converted int
+    LENGTH_DEFAULTS = {
+        'strong_password': 24,
+        'hex_key': 32,
+        'base64_password': 12,
+        's3_access_key': 20,
+    }
 
     def __init__(self, generator: CredentialGenerator, template: TemplateProcessor):
         self.generator = generator
         self.template = template
-
-    def parse(self, comment: str) -> Optional[Dict[str, Any]]:
-        """Parse a GENERATE directive from a comment."""
-        match = self.DIRECTIVE_PATTERN.search(comment)
-        if not match:
-            return None
-
-        directive_type = match.group(1)
-        args = match.group(2) or ''
-
-        return {
-            'type': directive_type,
-            'args': args,
+        self._tz_cache: Optional[str] = None
+
+        # Directive handlers keyed by type: one dict lookup per directive
+        # instead of walking an if/elif chain of string comparisons.
+        # Credential handlers receive their length pre-parsed as an int.
+        self._dispatch = {
+            'strong_password': generator.strong_password,
+            'hex_key': generator.hex_key,
+            'base64_password': generator.base64_password,
+            's3_access_key': generator.s3_access_key,
+            'template': template.process,
+            'auto_detect_timezone': lambda arg: self._detect_timezone(),
+            'manual': lambda arg: None,  # Keep original value
         }
 
-    def generate_value(self, directive: Dict[str, Any]) -> Optional[str]:
-        """Generate a value based on directive type."""
-        dtype = directive['type']
-        args = directive['args']
-
-        # Credential generation
-        if dtype == 'strong_password':
-            length = int(args) if args else 24
-            return self.generator.strong_password(length)
+    def parse(self, comment: str) -> Optional[re.Match]:
+        """Match a GENERATE directive comment, or return None."""
+        return self.DIRECTIVE_PATTERN.match(comment)
 
-        elif dtype == 'hex_key':
-            length = int(args) if args else 32
-            return self.generator.hex_key(length)
-
-        elif dtype == 'base64_password':
-            length = int(args) if args else 12
-            return self.generator.base64_password(length)
-
-        elif dtype == 's3_access_key':
-            length = int(args) if args else 20
-            return self.generator.s3_access_key(length)
-
-        # Template processing
-        elif dtype == 'template':
-            return self.template.process(args)
-
-        # System detection
-        elif dtype == 'auto_detect_timezone':
-            return self._detect_timezone()
-
-        elif dtype == 'manual':
-            return None  # Keep original value
-
-        return None
+    def generate_value(self, dtype: str, arg) -> Optional[str]:
+        """Generate a value for a parsed directive."""
+        handler = self._dispatch.get(dtype)
+        if handler is None:
+            return None
+        return handler(arg)
 
     def _detect_timezone(self) -> str:
-        """Detect system timezone."""
-        if os.path.exists('/etc/timezone'):
+        """Detect system timezone (cached after the first lookup)."""
+        if self._tz_cache is None:
+            self._tz_cache = self._lookup_timezone()
+        return self._tz_cache
+
+    def _lookup_timezone(self) -> str:
+        """Look up the system timezone from OS sources."""
+        # Raw read: the file holds one short zone name, so skip the
+        # exists() probe and TextIOWrapper for a single open + read
+        try:
+            fd = os.open('/etc/timezone', os.O_RDONLY)
             try:
-                with open('/etc/timezone', 'r') as f:
-                    return f.read().strip()
-            except:
+                data = os.read(fd, 128)
+            finally:
+                os.close(fd)
+            # Zone names are ASCII; garbage content falls through to the
+            # next source instead of aborting the setup
+            tz = data.decode('ascii').strip()
+        except (OSError, UnicodeDecodeError):
+            pass
+        else:
+            if tz:
+                return tz
+
+        # Try the /etc/localtime symlink (macOS has no /etc/timezone);
+        # one readlink + find, no Path object or subprocess needed
+        if os.path.islink('/etc/localtime'):
+            try:
+                link = os.readlink('/etc/localtime')
+            except OSError:
                 pass
+            else:
+                idx = link.find('zoneinfo/')
+                if idx >= 0:
+                    return link[idx + len('zoneinfo/'):]
 
         # Try TZ environment variable
         tz = os.environ.get('TZ')
@@ -167,6 +202,33 @@ class DirectiveParser:
         return 'America/New_York'
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_template(path: str, mtime: float) -> tuple:
+    """Parse a template into (line, dtype, arg, var_line) entries.
+
+    Cached on (path, mtime) so repeated runs against the same template —
+    dry-run previews, tests — skip the file read, regex matching, and
+    argument conversion, and only regenerate directive values.
+    """
+    entries = []
+    lines = Path(path).read_text(encoding='utf-8').splitlines(keepends=True)
+    it = iter(lines)
+    for line in it:
+        match = DirectiveParser.DIRECTIVE_PATTERN.match(line)
+        if match:
+            dtype = match.group(1)
+            args = match.group(2) or ''
+            default = DirectiveParser.LENGTH_DEFAULTS.get(dtype)
+            if default is not None:
+                arg = int(args) if args else default
+            else:
+                arg = args
+            entries.append((line, dtype, arg, next(it, None)))
+        else:
+            entries.append((line, None, None, None))
+    return tuple(entries)
+
+
 class EnvSetup:
     """Main environment setup handler."""
 
@@ -191,14 +253,22 @@ class EnvSetup:
 
     def check_prerequisites(self) -> bool:
         """Check if setup can proceed."""
-        # Check for .env.example
-        if not self.env_example.exists():
+        # Check for .env.example; one stat syscall via try/except rather
+        # than an exists() probe followed by the eventual open()
+        try:
+            os.stat(self.env_example)
+        except FileNotFoundError:
             print(f"❌ Error: {self.env_example} not found")
             print("Make sure you're in the project root directory")
             return False
 
         # Check for existing .env
-        if self.env_file.exists() and not self.dry_run:
+        try:
+            env_file_exists = not self.dry_run and os.stat(self.env_file) is not None
+        except FileNotFoundError:
+            env_file_exists = False
+
+        if env_file_exists:
             print(f"❌ Error: {self.env_file} already exists")
             print("\nTo regenerate, first backup and remove the existing file:")
             print(f"  cp .env .env.backup")
@@ -210,49 +280,32 @@ class EnvSetup:
 
     def process_file(self) -> str:
         """Process .env.example and generate .env content."""
-        output_lines = []
-
-        with open(self.env_example, 'r') as f:
-            lines = f.readlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for directive comment
-            if line.strip().startswith('#') and 'GENERATE:' in line:
-                directive = self.parser.parse(line)
-
-                if directive:
-                    # Add the comment line
-                    output_lines.append(line)
-
-                    # Process the next line (the actual variable)
-                    if i + 1 < len(lines):
-                        i += 1
-                        var_line = lines[i]
-
-                        # Generate value if needed
-                        value = self.parser.generate_value(directive)
-
-                        if value is not None:
-                            # Replace the value in the variable line
-                            if '=' in var_line:
-                                var_name = var_line.split('=')[0]
-                                output_lines.append(f"{var_name}={value}\n")
-                            else:
-                                output_lines.append(var_line)
-                        else:
-                            # Keep original line for manual directives
-                            output_lines.append(var_line)
+        # Parse once per (path, mtime); repeat runs reuse the parsed form
+        entries = _parse_template(str(self.env_example), self.env_example.stat().st_mtime)
+        return ''.join(self._iter_output(entries))
+
+    def _iter_output(self, entries) -> Iterator[str]:
+        """Yield output lines from parsed (line, dtype, arg, var_line) entries."""
+        for line, dtype, arg, var_line in entries:
+            yield line
+            if dtype is None:
+                continue
+
+            # Rewrite the variable line that followed the directive comment
+            if var_line is None:
+                return
+
+            # Generate value if needed
+            value = self.parser.generate_value(dtype, arg)
+            if value is not None:
+                var_name, sep, _ = var_line.partition('=')
+                if sep:
+                    yield f"{var_name}={value}\n"
                 else:
-                    output_lines.append(line)
+                    yield var_line
             else:
-                output_lines.append(line)
-
-            i += 1
-
-        return ''.join(output_lines)
+                # Keep original line for manual directives
+                yield var_line
 
     def run(self) -> bool:
         """Run the setup process."""
@@ -271,13 +324,15 @@ class EnvSetup:
                 print(content)
                 print("=" * 50)
             else:
-                with open(self.env_file, 'w') as f:
-                    f.write(content)
-                print(f"\n✅ Successfully created {self.env_file}")
-                print("\n🔒 Security Notes:")
-                print("   • Secure passwords generated for all services")
-                print("   • Never commit .env to version control")
-                print("   • Keep .env.backup if you need to restore")
+                self.env_file.write_text(content, encoding='utf-8')
+                # One print per banner block: one stdout lock/flush cycle
+                print(
+                    f"\n✅ Successfully created {self.env_file}\n"
+                    "\n🔒 Security Notes:\n"
+                    "   • Secure passwords generated for all services\n"
+                    "   • Never commit .env to version control\n"
+                    "   • Keep .env.backup if you need to restore"
+                )
 
                 self._print_next_steps()
 
@@ -289,14 +344,18 @@ class EnvSetup:
 
     def _print_next_steps(self):
         """Print next steps after successful setup."""
-        print("\n📋 Next Steps:")
-        print("   1. Review the generated .env file")
-        print("   2. Update any 'manual' entries (API keys, etc.)")
-        print("   3. Run: docker compose up -d")
-        print("   4. Access n8n at: http://localhost:5678")
+        msg = (
+            "\n📋 Next Steps:\n"
+            "   1. Review the generated .env file\n"
+            "   2. Update any 'manual' entries (API keys, etc.)\n"
+            "   3. Run: docker compose up -d\n"
+            "   4. Access n8n at: http://localhost:5678"
+        )
 
         if self.config['hostname'] != 'localhost':
-            print(f"\n🌐 Production URL: https://{self.config['hostname']}")
+            msg += f"\n\n🌐 Production URL: https://{self.config['hostname']}"
+
+        print(msg)
 
 
 def main():